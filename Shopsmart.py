@@ -1,19 +1,126 @@
+import atexit
+import csv
 import json
 import os
-from datetime import datetime
+import queue
+import sys
+import threading
+from datetime import date
+from operator import attrgetter
+
+try:
+    # orjson parses and serializes JSON in C and is much faster than the stdlib
+    # json module on large purchase files. It is optional: without it we fall
+    # back to json, which produces the same file format.
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Configuration and Data Storage ---
 
 # The name of the file where purchase data will be stored persistently.
-DATA_FILE = 'purchases.json'
+# It is an append-only log with one JSON change record per line, so each
+# add, update or delete writes a single line instead of the whole file.
+DATA_FILE = 'purchases.jsonl'
 
-# Global list to hold all purchase items in memory during the session.
+# The single-document JSON file used by earlier versions. Its records are
+# imported into the log the first time the log does not exist yet.
+LEGACY_DATA_FILE = 'purchases.json'
+
+# The file written by the "Export" menu option: an indented, human-readable
+# JSON copy of the current records (in the same layout as LEGACY_DATA_FILE).
+EXPORT_FILE = 'purchases_export.json'
+
+# Global list to hold all purchase items (Purchase objects) in memory during the session.
 purchases = []
 
+# Index of the same purchase items keyed by ID, for constant-time lookups.
+_by_id = {}
+
+# The ID that will be given to the next new purchase. IDs only ever increase,
+# so deleting a record never renumbers the others. Saved in the log as well.
+_next_id = 1
+
+# Whether load_data has run yet. Loading is deferred until an operation needs
+# the records, so quick sessions (e.g. only adding) never parse the whole log.
+_loaded = False
+
+# Whether _next_id is up to date, either from a full load or from peek_next_id.
+_next_id_known = False
+
+# True when the log holds changes that have not been compacted by save_data
+# yet. Only real changes set it, so save_data can skip no-op rewrites.
+_dirty = False
+
+# Set when load_data could not read the saved data. The log may still hold
+# records that are not in memory, so save_data must not compact over it.
+_load_failed = False
+
+# Running spending totals per category, as {category: [total, count]}. They are
+# updated on every change so the summary report never rescans the purchases.
+_category_totals = {}
+
+# Today's date and its 'YYYY-MM-DD' string, cached by today_str().
+_today = None
+_today_str = None
+
+# Log lines waiting to be written to DATA_FILE by the background writer thread,
+# so the menu never blocks on disk writes. The thread is started on first use.
+_write_queue = queue.Queue()
+_writer_thread = None
+
+# Number of queued changes the writer thread failed to write. flush_writes
+# reports them, so a failure is never only a message from the background.
+_failed_writes = 0
+
+# Row layout used by display_purchases. Pulling the fields out with attrgetter
+# and filling a bound format method avoids five separate lookups and an
+# f-string per row. The precisions (.25, .15, .10) truncate long values.
+_row_fields = attrgetter('id', 'item_name', 'category', 'cost', 'purchase_date')
+_row_format = "{:<6} | {:<25.25} | {:<15.15} | {:>10} | {:<10.10}".format
+
+# --- Data Model ---
+
+class Purchase:
+    """A single purchase record.
+
+    __slots__ stores the fields in fixed slots instead of a per-record dict,
+    which makes each record several times smaller in memory.
+    """
+    __slots__ = ('id', 'item_name', 'category', 'cost', 'purchase_date', '_name_lc', '_cat_lc')
+
+    # The fields that are saved to disk, in order. The cost is a whole number of
+    # cents, so money sums stay exact. Fields starting with '_' are in-memory only.
+    FIELDS = ('id', 'item_name', 'category', 'cost', 'purchase_date')
+
+    def __init__(self, id, item_name, category, cost, purchase_date):
+        self.id = id
+        self.item_name = item_name
+        self.category = category
+        self.cost = cost
+        self.purchase_date = purchase_date
+
+    @classmethod
+    def from_dict(cls, data):
+        """Creates a Purchase from a saved record dict."""
+        return cls(*[data[field] for field in cls.FIELDS])
+
+    def to_dict(self):
+        """Returns the saved fields as a dict, ready for JSON serialization."""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def update(self, fields):
+        """Sets the saved fields given in a {field: value} dict."""
+        for field in fields:
+            if field not in self.FIELDS:
+                raise KeyError(field)
+        for field, value in fields.items():
+            setattr(self, field, value)
+
 # --- Helper Functions ---
 
-def validate_float_input(prompt, default_value=None):
-    """Prompts for a float input and handles ValueError for robustness."""
+def validate_cost_input(prompt, default_value=None):
+    """Prompts for a dollar amount and returns it as whole cents, handling invalid input."""
     while True:
         value_input = input(prompt).strip()
         
@@ -26,94 +133,437 @@ def validate_float_input(prompt, default_value=None):
             continue
             
         try:
-            # Ensure we treat '0' correctly as a float
-            return float(value_input)
-        except ValueError:
+            # Ensure we treat '0' correctly
+            return parse_cents(value_input)
+        except (ValueError, OverflowError):
             print("[ERROR] Invalid input. Please enter a numerical value (e.g., 19.99).")
 
+def parse_cents(value):
+    """Converts a dollar amount such as '19.99' to whole cents, rounding to the nearest cent."""
+    cents = round(float(value) * 100)
+    if not is_valid_cents(cents):
+        raise ValueError(f"cost out of range: {value}")
+    return cents
+
+def is_valid_cents(cents):
+    """Checks that a cost is a whole number of cents that JSON libraries can store."""
+    # orjson only writes 64-bit integers, and bool is a subclass of int
+    return isinstance(cents, int) and not isinstance(cents, bool) and abs(cents) < 2**63
+
+def today_str():
+    """Returns today's date as 'YYYY-MM-DD', formatting it only when the day changes."""
+    global _today, _today_str
+    today = date.today()
+    if today != _today:
+        _today = today
+        _today_str = today.isoformat()
+    return _today_str
+
+def format_cents(cents):
+    """Formats a whole number of cents as a dollar amount, e.g. 1999 -> '$19.99'."""
+    sign = '-' if cents < 0 else ''
+    dollars, remainder = divmod(abs(cents), 100)
+    return f"{sign}${dollars}.{remainder:02d}"
+
+def cents_from_stored(fields):
+    """Converts a cost saved by older versions as float dollars to cents, in place."""
+    if isinstance(fields.get('cost'), float):
+        fields['cost'] = round(fields['cost'] * 100)
+
+def check_stored_fields(fields):
+    """Raises TypeError if a saved record holds a field of the wrong type."""
+    if 'cost' in fields and not is_valid_cents(fields['cost']):
+        raise TypeError(f"invalid cost: {fields['cost']!r}")
+    for field in ('item_name', 'category'):
+        if field in fields and not isinstance(fields[field], str):
+            raise TypeError(f"invalid {field}: {fields[field]!r}")
+
 def display_purchases(items_list):
     """A helper function to display a list of purchase items clearly."""
     if not items_list:
         print("No purchases found matching your criteria.")
         return
 
-    # Column formatting for clear display
-    print("-" * 70)
-    print(f"{'ID':<4} | {'Item Name':<25} | {'Category':<15} | {'Cost':>10} | {'Date':<10}")
-    print("-" * 70)
-
-    for item in items_list:
-        # Format cost to two decimal places for currency
-        cost_formatted = f"${item['cost']:.2f}"
-        
-        # Display the purchase details
-        print(f"{item['id']:<4} | {item['item_name'][:25]:<25} | {item['category'][:15]:<15} | {cost_formatted:>10} | {item['purchase_date'][:10]:<10}")
-
-    print("-" * 70)
-    print(f"Displayed Purchases: {len(items_list)}")
+    # Column formatting for clear display. The whole table is built first and
+    # written in one call instead of printing (and locking stdout) per row.
+    lines = [
+        "-" * 72,
+        f"{'ID':<6} | {'Item Name':<25} | {'Category':<15} | {'Cost':>10} | {'Date':<10}",
+        "-" * 72,
+    ]
+
+    # Add the purchase details (cost is formatted as dollars and cents)
+    for item_id, item_name, category, cost, purchase_date in map(_row_fields, items_list):
+        lines.append(_row_format(item_id, item_name, category, format_cents(cost), purchase_date))
+
+    lines.append("-" * 72)
+    lines.append(f"Displayed Purchases: {len(items_list)}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def prepare_item(item):
+    """Interns the category of a purchase item and caches lowercase search fields on it."""
+    # Many items share a few categories; interning keeps one string object per
+    # category and lets dict lookups on it (e.g. the totals) compare by identity
+    item.category = sys.intern(item.category)
+
+    # Lowercase copies for search; these are kept in memory only and never saved
+    item._name_lc = item.item_name.lower()
+    item._cat_lc = sys.intern(item.category.lower())
+
+def add_to_totals(item):
+    """Adds a purchase item's cost to the running totals of its category."""
+    totals = _category_totals.setdefault(item.category.strip(), [0, 0])
+    totals[0] += item.cost
+    totals[1] += 1
+
+def remove_from_totals(item):
+    """Removes a purchase item's cost from the running totals of its category."""
+    category = item.category.strip()
+    totals = _category_totals[category]
+    totals[0] -= item.cost
+    totals[1] -= 1
+
+    # Drop categories that no longer have any purchases
+    if not totals[1]:
+        del _category_totals[category]
+
+def find_matching_purchases(items_list, search_term):
+    """Returns the items whose name or category contains the lowercase search term."""
+    # Compares against the cached lowercase fields, so no strings are created per item
+    return [item for item in items_list
+            if search_term in item._name_lc or search_term in item._cat_lc]
 
 # --- File Handling Functions (Persistent Storage) ---
 
+def _json_loads(raw_bytes):
+    """Parses JSON from raw bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw_bytes)
+    return json.loads(raw_bytes)
+
+def _json_dumps_line(data):
+    """Serializes data to one line of compact JSON bytes, using orjson when it is installed."""
+    # Purchase objects are written out through their to_dict() method
+    if orjson is not None:
+        return orjson.dumps(data, default=Purchase.to_dict, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, default=Purchase.to_dict, separators=(',', ':')).encode('utf-8') + b'\n'
+
+def _json_dumps_pretty(data):
+    """Serializes data to indented, human-readable JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=Purchase.to_dict, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, default=Purchase.to_dict, indent=2, ensure_ascii=False).encode('utf-8')
+
+def apply_log_entry(entry):
+    """Applies one change record from the log to the in-memory ID index."""
+    global _next_id
+    op = entry['op']
+
+    if op == 'add':
+        cents_from_stored(entry['item'])
+        check_stored_fields(entry['item'])
+        item = Purchase.from_dict(entry['item'])
+        prepare_item(item)
+        _by_id[item.id] = item
+        # Deleted items keep their IDs reserved, so track every ID ever added
+        _next_id = max(_next_id, item.id + 1)
+    elif op == 'update':
+        item = _by_id[entry['id']]
+        cents_from_stored(entry['fields'])
+        # Check before updating, so a skipped line leaves the item unchanged
+        check_stored_fields(entry['fields'])
+        item.update(entry['fields'])
+        prepare_item(item)
+    elif op == 'delete':
+        _by_id.pop(entry['id'], None)
+    elif op == 'meta':
+        _next_id = max(_next_id, entry['next_id'])
+    else:
+        raise ValueError(f"unknown log operation '{op}'")
+
 def load_data():
-    """Loads purchase items from the JSON file into the global list."""
-    global purchases
+    """Loads purchase items by replaying the log file into the global list."""
+    global purchases, _by_id, _next_id, _dirty, _loaded, _next_id_known, _load_failed
+    _by_id = {}
+    _next_id = 1
+    rewrite_log = False
     try:
         if os.path.exists(DATA_FILE) and os.path.getsize(DATA_FILE) > 0:
-            with open(DATA_FILE, 'r') as f:
-                purchases = json.load(f)
+            log_lines = 0
+            skipped_lines = 0
+            with open(DATA_FILE, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    log_lines += 1
+                    # A crash during an append can leave a partial last line;
+                    # skip unreadable lines rather than discarding everything.
+                    try:
+                        apply_log_entry(_json_loads(line))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        skipped_lines += 1
+
+            purchases = list(_by_id.values())
             print(f"\n[INFO] Loaded {len(purchases)} purchase records from {DATA_FILE}.")
+
+            # A compacted log is one counter line plus one line per item; any
+            # more means earlier changes are still waiting to be compacted
+            _dirty = log_lines > len(purchases) + 1
+            if skipped_lines:
+                print(f"[WARNING] Skipped {skipped_lines} unreadable lines in {DATA_FILE}.")
+                # Rewrite the log so new lines are not appended to a partial one
+                rewrite_log = True
+        elif os.path.exists(LEGACY_DATA_FILE) and os.path.getsize(LEGACY_DATA_FILE) > 0:
+            with open(LEGACY_DATA_FILE, 'rb') as f:
+                data = _json_loads(f.read())
+
+            if isinstance(data, list):
+                # The oldest files hold a bare list of purchases without the ID counter
+                records = data
+            else:
+                records = data['items']
+                _next_id = data['next_id']
+
+            purchases = []
+            for record in records:
+                cents_from_stored(record)
+                check_stored_fields(record)
+                item = Purchase.from_dict(record)
+                prepare_item(item)
+                purchases.append(item)
+            _by_id = {item.id: item for item in purchases}
+            print(f"\n[INFO] Imported {len(purchases)} purchase records from {LEGACY_DATA_FILE}.")
+
+            # Write the imported records out as the starting point of the log
+            rewrite_log = True
         else:
             purchases = []
             print(f"\n[INFO] {DATA_FILE} not found or empty. Starting with an empty list.")
     except json.JSONDecodeError:
         print("\n[ERROR] Data file is corrupted (JSON Error). Starting with an empty list.")
         purchases = []
+        _by_id = {}
+        _load_failed = True
     except Exception as e:
         print(f"\n[ERROR] An unexpected error occurred while loading data: {e}")
         purchases = []
+        _by_id = {}
+        _load_failed = True
+
+    if _load_failed:
+        # Keep new IDs clear of the ones already in the unreadable log
+        _next_id = max(_next_id, peek_next_id() or 1)
+
+    _category_totals.clear()
+    for item in purchases:
+        add_to_totals(item)
+
+    # Never hand out an ID that is already in use, even if a saved counter is
+    # missing or out of date. The highest ID is found once here, independent of
+    # the order of the list, so add_purchase() only has to increment it.
+    _next_id = max(_next_id, max(_by_id, default=0) + 1)
+    _next_id_known = True
+    _loaded = True
+
+    if rewrite_log:
+        _dirty = True
+        save_data()
+
+def ensure_loaded():
+    """Loads the purchase data the first time an operation needs it."""
+    if not _loaded:
+        # Records appended before the first load must be on disk to be replayed
+        flush_writes()
+        load_data()
+
+def peek_next_id():
+    """Finds the next free ID from the first and last lines of the log, without replaying it.
+
+    Returns None when that is not possible and the data has to be loaded instead:
+    the log is unreadable, ends in a partial line, or an older data file still
+    has to be imported.
+    """
+    if not os.path.exists(DATA_FILE) or os.path.getsize(DATA_FILE) == 0:
+        return None if os.path.exists(LEGACY_DATA_FILE) else 1
+
+    try:
+        with open(DATA_FILE, 'rb') as f:
+            # A compacted log starts with the saved ID counter
+            next_id = 1
+            first_entry = _json_loads(f.readline())
+            if first_entry['op'] == 'meta':
+                next_id = first_entry['next_id']
+
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                return None
+
+            # IDs are appended in increasing order, so the last 'add' line holds
+            # the highest ID. Read the file backwards in blocks until it is found.
+            position = f.seek(0, os.SEEK_END)
+            partial_line = b''
+            while position > 0:
+                block_size = min(4096, position)
+                position -= block_size
+                f.seek(position)
+                lines = (f.read(block_size) + partial_line).split(b'\n')
+
+                # The first piece may be cut off unless the start of the file was reached
+                partial_line = lines.pop(0) if position > 0 else b''
+                for line in reversed(lines):
+                    if not line.strip():
+                        continue
+                    entry = _json_loads(line)
+                    if entry['op'] == 'add':
+                        return max(next_id, entry['item']['id'] + 1)
+                    if entry['op'] == 'meta':
+                        return max(next_id, entry['next_id'])
+            return next_id
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def ensure_next_id():
+    """Makes sure _next_id is up to date, loading the data only if it has to."""
+    global _next_id, _next_id_known
+    if _next_id_known:
+        return
+
+    next_id = peek_next_id()
+    if next_id is None:
+        ensure_loaded()
+    else:
+        _next_id = next_id
+        _next_id_known = True
+
+def _log_writer():
+    """Runs in the background, appending queued log lines to the log file."""
+    global _failed_writes
+    while True:
+        batch = [_write_queue.get()]
+        # Take everything else already queued so it shares one write and fsync
+        while not _write_queue.empty():
+            batch.append(_write_queue.get_nowait())
+
+        try:
+            with open(DATA_FILE, 'ab') as f:
+                f.write(b''.join(batch))
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            _failed_writes += len(batch)
+            print(f"\n[ERROR] Could not save data: {e}")
+        finally:
+            for _ in batch:
+                _write_queue.task_done()
+
+def append_log(*entries):
+    """Queues change records to be appended to the end of the log file in one write."""
+    global _writer_thread, _dirty
+    _dirty = True
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(target=_log_writer, daemon=True)
+        _writer_thread.start()
+        # Also flush if the program ends unexpectedly (e.g. Ctrl+C)
+        atexit.register(flush_writes)
+    _write_queue.put(b''.join(map(_json_dumps_line, entries)))
+
+def flush_writes():
+    """Blocks until every queued log line has been written to disk.
+
+    Returns False (after telling the user) if any queued change could not be written.
+    """
+    global _failed_writes
+    _write_queue.join()
+
+    if _failed_writes:
+        print(f"\n[ERROR] {_failed_writes} change(s) could not be written to {DATA_FILE}.")
+        _failed_writes = 0
+        return False
+    return True
 
 def save_data():
-    """Saves the current purchase items from the global list to the JSON file."""
+    """Compacts the log file so it holds only the current purchase items.
+
+    Returns True if every change made so far is safely on disk.
+    """
+    global _dirty
+
+    # Let pending appends land first so they cannot be written after the rewrite
+    writes_ok = flush_writes()
+
+    # Without loaded data there is nothing to compact; appended lines are kept
+    if not _dirty or not _loaded:
+        return writes_ok
+
+    if _load_failed:
+        print(f"\n[WARNING] {DATA_FILE} could not be read, so it is left as is.")
+        return writes_ok
+
+    # The compacted log is the ID counter followed by one 'add' line per item
+    lines = [_json_dumps_line({"op": "meta", "next_id": _next_id})]
+    lines.extend(_json_dumps_line({"op": "add", "item": item}) for item in purchases)
+
+    # Write a temporary file and swap it in with one atomic rename, so a crash
+    # mid-write leaves the previous log intact instead of a truncated one
+    temp_file = DATA_FILE + '.tmp'
     try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(purchases, f, indent=4)
+        with open(temp_file, 'wb') as f:
+            f.write(b''.join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, DATA_FILE)
+        _dirty = False
         print(f"\n[INFO] Successfully saved {len(purchases)} records to {DATA_FILE}.")
+        # The rewrite includes every in-memory change, even ones whose append failed
+        return True
     except Exception as e:
         print(f"\n[ERROR] Could not save data: {e}")
+        return False
 
 # --- Core Operations (CRUD) ---
 
 def add_purchase():
     """Prompts user for a new purchase item and adds it to the list."""
+    global _next_id
     print("\n--- Add New Purchase Record ---")
     
     item_name = input("Item Name: ").strip()
     category = input("Category (e.g., Groceries, Electronics, Clothes): ").strip()
     
     # Use helper function to validate cost input
-    cost = validate_float_input("Cost ($): ")
+    cost = validate_cost_input("Cost ($): ")
     
     if not item_name or not category:
         print("[WARNING] Item Name and Category cannot be empty. Record not added.")
         return
 
-    # Assign a new unique ID, ensuring it is sequential even after deletions
-    new_id = (purchases[-1]['id'] + 1) if purchases else 1
+    # Assign a new unique ID; IDs of deleted records are never reused
+    ensure_next_id()
+    new_id = _next_id
+    _next_id += 1
     
-    new_purchase = {
-        "id": new_id,
-        "item_name": item_name,
-        "category": category if category else "General",
-        "cost": cost,
-        "purchase_date": datetime.now().strftime("%Y-%m-%d")
-    }
-
-    purchases.append(new_purchase)
-    save_data()
+    new_purchase = Purchase(
+        id=new_id,
+        item_name=item_name,
+        category=category if category else "General",
+        cost=cost,
+        purchase_date=today_str()
+    )
+
+    append_log({"op": "add", "item": new_purchase})
+
+    # Before the data is loaded, the record only needs to reach the log; it is
+    # picked up with the others when the log is replayed
+    if _loaded:
+        prepare_item(new_purchase)
+        purchases.append(new_purchase)
+        _by_id[new_id] = new_purchase
+        add_to_totals(new_purchase)
     print(f"\n[SUCCESS] Purchase '{item_name}' added successfully with ID: {new_id}.")
 
 def view_all_purchases():
     """Displays all stored purchase records."""
+    ensure_loaded()
     print("\n--- All Purchase Records ---")
     if not purchases:
         print("Your purchase list is currently empty. Add some records!")
@@ -122,6 +572,7 @@ def view_all_purchases():
 
 def update_purchase():
     """Prompts user for a purchase ID and allows modification of its details."""
+    ensure_loaded()
     print("\n--- Update Purchase Record ---")
     
     if not purchases:
@@ -144,40 +595,52 @@ def update_purchase():
         return
 
     # Find the item
-    record_to_update = next((p for p in purchases if p['id'] == id_to_update), None)
+    record_to_update = _by_id.get(id_to_update)
 
     if not record_to_update:
         print(f"[WARNING] Record with ID {id_to_update} not found.")
         return
 
-    print(f"\nEditing record: '{record_to_update['item_name']}' (ID: {id_to_update})")
+    print(f"\nEditing record: '{record_to_update.item_name}' (ID: {id_to_update})")
     print("--------------------------------------------------")
     print("💡 Tip: Leave a field blank to keep its current value.")
+
+    # Collect only the fields that change, so the log records a small patch
+    changes = {}
     
     # 1. Item Name
-    new_name = input(f"New Item Name (Current: '{record_to_update['item_name']}'): ").strip()
-    if new_name:
-        record_to_update['item_name'] = new_name
+    new_name = input(f"New Item Name (Current: '{record_to_update.item_name}'): ").strip()
+    if new_name and new_name != record_to_update.item_name:
+        changes['item_name'] = new_name
     
     # 2. Category
-    new_category = input(f"New Category (Current: '{record_to_update['category']}'): ").strip()
-    if new_category:
-        record_to_update['category'] = new_category
+    new_category = input(f"New Category (Current: '{record_to_update.category}'): ").strip()
+    if new_category and new_category != record_to_update.category:
+        changes['category'] = new_category
         
     # 3. Cost (Use helper function with current cost as default)
-    print(f"Current Cost: ${record_to_update['cost']:.2f}")
-    new_cost = validate_float_input("New Cost ($) (Press Enter to keep current): ", default_value=record_to_update['cost'])
+    print(f"Current Cost: {format_cents(record_to_update.cost)}")
+    new_cost = validate_cost_input("New Cost ($) (Press Enter to keep current): ", default_value=record_to_update.cost)
     
-    if new_cost != record_to_update['cost']:
-        record_to_update['cost'] = new_cost
-        record_to_update['purchase_date'] = datetime.now().strftime("%Y-%m-%d") # Update date on modification
+    if new_cost != record_to_update.cost:
+        changes['cost'] = new_cost
+        changes['purchase_date'] = today_str() # Update date on modification
+
+    if not changes:
+        print(f"\n[INFO] No changes made to record ID {id_to_update}.")
+        return
 
-    save_data()
+    remove_from_totals(record_to_update)
+    record_to_update.update(changes)
+    prepare_item(record_to_update)
+    add_to_totals(record_to_update)
+    append_log({"op": "update", "id": id_to_update, "fields": changes})
     print(f"\n[SUCCESS] Record ID {id_to_update} updated successfully.")
 
 
 def search_filter_purchases():
     """Allows users to search by item name/category."""
+    ensure_loaded()
     print("\n--- Search & Filter Purchases ---")
     
     if not purchases:
@@ -190,13 +653,7 @@ def search_filter_purchases():
         print("[INFO] Search cancelled.")
         return
 
-    results = []
-
-    for item in purchases:
-        # Check if keyword is in item_name or category (case-insensitive)
-        if (search_term in item['item_name'].lower() or
-            search_term in item['category'].lower()):
-            results.append(item)
+    results = find_matching_purchases(purchases, search_term)
     
     print(f"\n--- Search Results for '{search_term}' ---")
     display_purchases(results)
@@ -204,51 +661,41 @@ def search_filter_purchases():
 
 def summarize_report():
     """Generates summary reports (Total spent and average cost per category)."""
+    ensure_loaded()
     print("\n--- Category Spending Summary Report ---")
     
     if not purchases:
         print("[WARNING] The purchase list is empty. No data to report.")
         return
 
-    # Dictionary to store totals and counts for each category
-    # Structure: {'CategoryName': {'total': 0.0, 'count': 0}}
-    category_summary = {}
-    grand_total = 0.0
-
     # 1. Aggregate Data
-    for item in purchases:
-        category = item['category'].strip()
-        cost = item['cost']
-        
-        # Initialize category if it's the first time seeing it
-        if category not in category_summary:
-            category_summary[category] = {'total': 0.0, 'count': 0}
-            
-        category_summary[category]['total'] += cost
-        category_summary[category]['count'] += 1
-        grand_total += cost
+    # Per-category totals and counts are kept up to date as purchases change
+    grand_total = sum(total for total, _ in _category_totals.values())
         
-    # 2. Display Report
+    # 2. Display Report (built first and written in one call)
     
-    print("-" * 55)
-    print(f"{'Category':<20} | {'Total Spent':>15} | {'Avg. Item Cost':>15}")
-    print("-" * 55)
-
-    for category, data in category_summary.items():
-        total = data['total']
-        count = data['count']
-        average = total / count
+    lines = [
+        "-" * 55,
+        f"{'Category':<20} | {'Total Spent':>15} | {'Avg. Item Cost':>15}",
+        "-" * 55,
+    ]
+
+    for category, (total, count) in _category_totals.items():
+        # Average to the nearest cent
+        average = round(total / count)
         
-        # Display formatted output
-        print(f"{category:<20} | ${total:>14.2f} | ${average:>14.2f}")
+        # Add formatted output
+        lines.append(f"{category:<20} | {format_cents(total):>15} | {format_cents(average):>15}")
     
-    print("-" * 55)
-    print(f"{'GRAND TOTAL':<20} | ${grand_total:>14.2f} |")
-    print("-" * 55)
+    lines.append("-" * 55)
+    lines.append(f"{'GRAND TOTAL':<20} | {format_cents(grand_total):>15} |")
+    lines.append("-" * 55)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def delete_purchase():
     """Prompts user for a purchase ID and deletes the corresponding record."""
+    ensure_loaded()
     print("\n--- Delete Purchase Record ---")
     global purchases
 
@@ -270,22 +717,113 @@ def delete_purchase():
         print("[ERROR] Invalid input. Please enter a valid number ID.")
         return
 
-    initial_length = len(purchases)
-    
-    # Filter out the item with the matching ID
-    purchases = [p for p in purchases if p['id'] != id_to_delete]
+    # Remove the item with the matching ID from the index
+    deleted_item = _by_id.pop(id_to_delete, None)
 
-    if len(purchases) < initial_length:
+    if deleted_item is not None:
+        purchases = list(_by_id.values())
+        remove_from_totals(deleted_item)
         print(f"[SUCCESS] Record with ID {id_to_delete} has been deleted.")
-        
-        # Re-index remaining items to ensure IDs are contiguous
-        for index, item in enumerate(purchases):
-            item['id'] = index + 1
-        
-        save_data()
+        append_log({"op": "delete", "id": id_to_delete})
     else:
         print(f"[WARNING] Record with ID {id_to_delete} not found.")
 
+def export_purchases():
+    """Writes all purchase records to EXPORT_FILE as indented JSON for reading."""
+    ensure_loaded()
+    print("\n--- Export Records to JSON ---")
+
+    if not purchases:
+        print("[WARNING] The purchase list is empty. Nothing to export.")
+        return
+
+    # Costs are shown in dollars, as in LEGACY_DATA_FILE, rather than stored cents
+    items = [{**item.to_dict(), 'cost': item.cost / 100} for item in purchases]
+    data = {"next_id": _next_id, "items": items}
+
+    try:
+        with open(EXPORT_FILE, 'wb') as f:
+            f.write(_json_dumps_pretty(data))
+        print(f"[SUCCESS] Exported {len(purchases)} records to {EXPORT_FILE}.")
+    except Exception as e:
+        print(f"[ERROR] Could not export data: {e}")
+
+def import_csv():
+    """Adds every purchase listed in a CSV file as one batch with a single log write."""
+    global _next_id
+    print("\n--- Bulk Import Records from CSV ---")
+    print("💡 Tip: The file needs a header row with item_name, category and cost columns.")
+    print("   A purchase_date column (YYYY-MM-DD) is optional; it defaults to today.")
+
+    path = input("Enter the path of the CSV file to import (or press Enter to cancel): ").strip()
+
+    if not path:
+        print("[INFO] Import cancelled.")
+        return
+
+    new_purchases = []
+    skipped_rows = 0
+    ensure_next_id()
+    next_id = _next_id
+
+    try:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            missing_columns = {'item_name', 'category', 'cost'} - set(reader.fieldnames or [])
+            if missing_columns:
+                print(f"[ERROR] The CSV file is missing the column(s): {', '.join(sorted(missing_columns))}.")
+                return
+
+            # Rows are read one at a time; short rows give None for missing values
+            for row in reader:
+                item_name = (row['item_name'] or '').strip()
+                category = (row['category'] or '').strip()
+                purchase_date = (row.get('purchase_date') or '').strip()
+
+                try:
+                    cost = parse_cents(row['cost'])
+                    purchase_date = date.fromisoformat(purchase_date).isoformat() if purchase_date else today_str()
+                except (TypeError, ValueError, OverflowError):
+                    skipped_rows += 1
+                    continue
+
+                if not item_name or not category:
+                    skipped_rows += 1
+                    continue
+
+                new_purchases.append(Purchase(
+                    id=next_id,
+                    item_name=item_name,
+                    category=category,
+                    cost=cost,
+                    purchase_date=purchase_date
+                ))
+                next_id += 1
+    except Exception as e:
+        print(f"[ERROR] Could not read {path}: {e}")
+        return
+
+    if skipped_rows:
+        print(f"[WARNING] Skipped {skipped_rows} rows with missing or invalid values.")
+
+    if not new_purchases:
+        print("[WARNING] No valid records found. Nothing imported.")
+        return
+
+    # Log the whole batch with a single write
+    _next_id = next_id
+    append_log(*({"op": "add", "item": item} for item in new_purchases))
+
+    # As in add_purchase, unloaded data picks the records up from the log later
+    if _loaded:
+        for item in new_purchases:
+            prepare_item(item)
+            _by_id[item.id] = item
+            add_to_totals(item)
+        purchases.extend(new_purchases)
+
+    print(f"[SUCCESS] Imported {len(new_purchases)} records from {path}.")
+
 # --- Menu Controller and Main Loop ---
 
 def display_menu():
@@ -299,16 +837,18 @@ def display_menu():
     print("4. Update Record Details")
     print("5. Delete Record")
     print("6. Generate Summary Report (Totals & Averages)")
+    print("7. Export Records to JSON (Human-Readable)")
+    print("8. Bulk Import Records from CSV")
     print("0. Exit and Save")
     print("="*45)
 
 def main():
     """Main function that runs the application loop."""
-    load_data()
+    # The data is loaded on first use (see ensure_loaded), not at startup
 
     while True:
         display_menu()
-        choice = input("Enter your choice (0-6): ").strip()
+        choice = input("Enter your choice (0-8): ").strip()
 
         if choice == '1':
             add_purchase()
@@ -322,13 +862,18 @@ def main():
             delete_purchase() 
         elif choice == '6':
             summarize_report()
+        elif choice == '7':
+            export_purchases()
+        elif choice == '8':
+            import_csv()
         elif choice == '0':
             print("\nExiting ShopSmart. Goodbye!")
-            save_data()
+            if not save_data():
+                print("[WARNING] Some changes were NOT saved. See the errors above.")
             input("Press Enter to close the program...")
             break
         else:
-            print("\n[WARNING] Invalid choice. Please enter a number between 0 and 6.")
+            print("\n[WARNING] Invalid choice. Please enter a number between 0 and 8.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file